@@ -5,7 +5,7 @@ from typing import Any, Self, Type, Union
 from . import configio
 from . import spec
 from .json import JsonWriter
-from .toml import TomlWriter
+from .toml import RtomlWriter, TomlWriter
 
 
 class _ConfigSpecMeta(type):
@@ -42,27 +42,40 @@ class _ConfigSpecMeta(type):
 
     def __getattribute__(self, name):
         """get attributes from active instance if available"""
+        if name.startswith("__"):  # dunders are never fields
+            return super().__getattribute__(name)
+
         inst = object.__getattribute__(self, "_INST")
-        if inst is not None and name in inst._ALL_FIELDS.keys():
-            return inst.__getattribute__(name)
+        if inst is not None and name in inst._ALL_FIELD_NAMES:
+            return inst._value[name]
 
         return super().__getattribute__(name)
 
-    def __setattribute__(self, name, value):
-        """set attributes from active instance if available"""
-        inst = object.__getattribute__(self, "_INST")
-        if inst is not None and name in inst._ALL_FIELDS.keys():
-            return inst.__setattribute__(name, value)
+    def __setattr__(self, name, value):
+        """set fields on the active instance,
+        the field descriptors on the class are never replaced"""
+        # not set yet while the class itself is being created
+        if name in getattr(self, "_ALL_FIELD_NAMES", ()):
+            inst = object.__getattribute__(self, "_INST")
+            if inst is None:
+                raise AttributeError(
+                    f"can't set field {name!r} of {self.__name__} without a loaded configuration"
+                )
+            return setattr(inst, name, value)
 
         return super().__setattr__(name, value)
 
 
-class _ConfigSpecABCMeta(spec.ConfigurationFieldABCMeta, _ConfigSpecMeta):
+class _ConfigSpecABCMeta(spec.SectionMeta, _ConfigSpecMeta):
     """A combination of ABCMeta and config spec meta"""
 
+    __get__ = _ConfigSpecMeta.__get__
+
 
 class ConfigSpec(spec.Section, metaclass=_ConfigSpecABCMeta):
 
+    __slots__ = ()
+
     @classmethod
     def __init_subclass__(
         cls,
@@ -80,7 +93,7 @@ class ConfigSpec(spec.Section, metaclass=_ConfigSpecABCMeta):
             raise Exception(f"configuration file: {cls._DEFAULT_FILE} is not a file")
 
         if exists:
-            cls._INST = cls(cls._WRITER.load(cls._DEFAULT_FILE))
+            cls._INST = cls._from_loaded(cls._WRITER.load(cls._DEFAULT_FILE))
         if not exists and cls._CREATE_FILE:
             default = cls()
             cls._WRITER.dump(cls._DEFAULT_FILE, default)
@@ -94,6 +107,13 @@ class ConfigSpec(spec.Section, metaclass=_ConfigSpecABCMeta):
 
         super().__init__(value or self._default_value)
 
+    @classmethod
+    def _from_loaded(cls, value: dict[str, Any]) -> Self:
+        """create config from freshly loaded data, an empty file means defaults"""
+        if not value and isinstance(cls._default_value, dict):
+            value = cls._default_value
+        return cls._from_dict_unchecked(value)
+
     @classmethod
     def load(cls, file=None, writer=None, /) -> Self:
         file = file or cls._DEFAULT_FILE
@@ -104,7 +124,7 @@ class ConfigSpec(spec.Section, metaclass=_ConfigSpecABCMeta):
         if file is None:
             raise Exception("No file specified")
 
-        return cls(writer.load(file))
+        return cls._from_loaded(writer.load(file))
 
     def save(self, file=None, writer=None, /):
         file = file or self._DEFAULT_FILE
@@ -122,10 +142,7 @@ class ConfigSpec(spec.Section, metaclass=_ConfigSpecABCMeta):
         if not self._has_default:
             raise Exception("Configuration does not have a full default value")
         self._value = {
-            self._FIELD_NAME_MAP[name]: self._ALL_FIELDS[self._FIELD_NAME_MAP[name]](
-                val
-            )
-            for name, val in self._default_value.items()
+            variable: field(default) for variable, field, default in self._DEFAULT_TRIPLES
         }
 
     @classmethod
@@ -137,8 +154,7 @@ class ConfigSpec(spec.Section, metaclass=_ConfigSpecABCMeta):
         if not cls._has_default:
             raise Exception("Configuration does not have a full default value")
         cls._INST._value = {
-            cls._FIELD_NAME_MAP[name]: cls._ALL_FIELDS[cls._FIELD_NAME_MAP[name]](val)
-            for name, val in cls._default_value.items()
+            variable: field(default) for variable, field, default in cls._DEFAULT_TRIPLES
         }
 
 
@@ -150,4 +166,5 @@ __all__ = [
     "configio",
     "JsonWriter",
     "TomlWriter",
+    "RtomlWriter",
 ]
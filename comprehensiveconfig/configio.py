@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from . import spec
 
+BUFFER_SIZE = 1 << 20
+"""buffer size used when opening config files,
+larger than the default so big configs take fewer read/write calls"""
+
 
 class ConfigurationWriter(ABC):
     """simple writer/reader base class that jus
@@ -17,13 +22,15 @@ class ConfigurationWriter(ABC):
 
     @classmethod
     @abstractmethod
-    def dump(cls, file, node: spec.AnyConfigField):
+    def dump(cls, file, node: spec.AnyConfigField, **kwargs):
+        """dump Configuration tree/node to a file,
+        extra keyword arguments are passed on to `dumps`"""
         if isinstance(file, (str, Path)):
-            with open(file, "w") as f:
-                f.write(cls.dumps(node))
+            with open(file, "w", buffering=BUFFER_SIZE) as f:
+                f.write(cls.dumps(node, **kwargs))
             return
 
-        file.write(cls.dumps(node))
+        file.write(cls.dumps(node, **kwargs))
 
     @classmethod
     @abstractmethod
@@ -36,7 +43,17 @@ class ConfigurationWriter(ABC):
     def load(cls, file) -> dict[str, Any]:
         """load a file by name"""
         if isinstance(file, (str, Path)):
-            with open(file, "r") as f:
+            with open(file, "r", buffering=BUFFER_SIZE) as f:
                 return cls.loads(f.read())
 
         return cls.loads(file.read())
+
+    @classmethod
+    def load_many(
+        cls, files: Iterable, max_workers: int | None = None
+    ) -> dict[Any, dict[str, Any]]:
+        """load several files by name, the reads are overlapped on a thread pool.
+        Returns the loaded data keyed by file"""
+        files = list(files)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return dict(zip(files, pool.map(cls.load, files)))
@@ -1,46 +1,105 @@
 import json
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
 from . import configio
 from . import spec
+from .spec import Section as _Section, Table as _Table
+
+_simd_loads: Callable[[bytes | str], Any] | None
+try:  # optional, much faster parser for loading
+    from simdjson import loads as _simd_loads
+except ImportError:
+    _simd_loads = None
+
+
+def _loads(data: bytes | str):
+    if _simd_loads is not None:
+        try:
+            return _simd_loads(data)
+        except (ValueError, RuntimeError):
+            # simdjson rejects some documents we write (inf/NaN, ints wider than 64 bits),
+            # those are retried here and real errors are raised as `json.JSONDecodeError`
+            pass
+    return json.loads(data)
+
+
+def _dump_section_value(writer, node, value):
+    return writer.dump_section(value)
+
+
+def _dump_table_value(writer, node: spec.Table, value):
+    if not node._holds_sections:
+        return value
+    return {
+        key: writer.dump_section(val) if isinstance(val, _Section) else val
+        for key, val in value.items()
+    }
+
+
+# encoders are reused between dumps
+# the compact one has no indent, so `encode` can use its C accelerated encoder
+# (`iterencode` is always pure python)
+_ENCODER = json.JSONEncoder(indent=4)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+# maps the type of a field to how its values are dumped, anything else is dumped as is
+_DUMP_DISPATCH = {
+    spec.SectionMeta: _dump_section_value,  # Section classes
+    _Table: _dump_table_value,
+}
 
 
 class JsonWriter(configio.ConfigurationWriter):
     @classmethod
     def dump_section(cls, node: spec.Section):
+        if node._IS_FLAT:
+            return dict(zip(node._CONFIG_NAMES, node._value.values()))
+        # `_value` is kept in the same order as `_FIELD_ITEMS`
         return {
-            node._FIELD_VAR_MAP[name]: (
-                cls.dump_value(node.get_field(name), value)
-            )
-            for name, value in node._value.items()
+            name: cls.dump_value(field, value)
+            for (name, _, field), value in zip(node._FIELD_ITEMS, node._value.values())
         }
     
     @classmethod
     def dump_value(cls, node: spec.AnyConfigField, value):
+        handler = _DUMP_DISPATCH.get(type(node))
+        if handler is None:
+            return value
+        return handler(cls, node, value)
+
+    @classmethod
+    def dumps(cls, node, compact: bool = False) -> str:
         match node:
-            case type() | spec.Section():
-                return cls.dump_section(value)
-            case spec.Table(_, type() | spec.Section() | spec.ConfigUnion()):
-                return {cls.dump_value(key, key): cls.dump_value(val, val) for key, val in value.items()}
+            case _Section():
+                encoder = _COMPACT_ENCODER if compact else _ENCODER
+                return encoder.encode(cls.dump_section(node))
             case _:
-                return value
+                raise ValueError(node)
 
     @classmethod
-    def dumps(cls, node) -> str:
+    def dumps_iter(cls, node, compact: bool = False) -> Iterator[str]:
+        """dump Configuration tree/node as string chunks (for large configs),
+        slower than `dumps` but the output is never held as one string"""
         match node:
-            case spec.Section():
-                return json.dumps(cls.dump_section(node), indent=4)
+            case _Section():
+                encoder = _COMPACT_ENCODER if compact else _ENCODER
+                return encoder.iterencode(cls.dump_section(node))
             case _:
                 raise ValueError(node)
 
     @classmethod
-    def dump(cls, file, node):
-        super().dump(file, node)
+    def dump(cls, file, node, **kwargs):
+        # encoded in one go, only `encode` can use the C accelerated encoder
+        super().dump(file, node, **kwargs)
 
     @classmethod
     def load(cls, file):
-        if isinstance(file, str):
-            with open(file, "r") as f:
-                return json.load(f)
-        return json.load(file)
+        if isinstance(file, (str, Path)):
+            with open(file, "rb", buffering=configio.BUFFER_SIZE) as f:
+                return _loads(f.read())
+        return _loads(file.read())
 
     # just alias the name
-    loads = json.loads
+    loads = staticmethod(_loads)
@@ -1,8 +1,10 @@
 from abc import ABC, ABCMeta, abstractmethod
+import functools
+from operator import attrgetter, itemgetter
 import re
 from types import UnionType
 import types
-from typing import Any, Self, Type, Union
+from typing import Any, Callable, ClassVar, Iterable, Self, Type, Union, cast
 import typing
 
 
@@ -18,6 +20,11 @@ class _NoDefaultValueT:
 # instantiate _NoDefaultValueT using object class's __new__ method
 NoDefaultValue = object.__new__(_NoDefaultValueT)
 
+# field projections used while building sections/tables, these run in C
+_get_name = attrgetter("_name")
+_get_default = attrgetter("_default_value")
+_get_has_default = attrgetter("_has_default")
+
 
 class ConfigurationFieldMeta(type):
     """Provides custom union logic for configuration fields"""
@@ -30,20 +37,41 @@ class ConfigurationFieldMeta(type):
         return Union[self, value]
 
 
+# both kinds of union `fix_unions` converts, looked up once
+_UNION_TYPES = (typing._UnionGenericAlias, types.UnionType)
+
+
 def fix_unions(union: UnionType | Any) -> "ConfigUnion | BaseConfigurationField":
-    if not isinstance(union, (typing._UnionGenericAlias, types.UnionType)):
+    if not isinstance(union, _UNION_TYPES):
         return union
-    left, *right = union.__args__
-    output = left
-    for typ in right:
-        output = ConfigUnion(output, typ)
-    return output
+    return _config_union_of(union.__args__)
+
+
+@functools.lru_cache(maxsize=256)
+def _config_union_of(types: tuple) -> "ConfigUnion":
+    """memoized so reusing a union alias doesn't rebuild it"""
+    return ConfigUnion(*types)
 
 
 class ConfigurationFieldABCMeta(ABCMeta, ConfigurationFieldMeta):
     pass
 
 
+class SectionMeta(ConfigurationFieldABCMeta):
+    """Lets nested section classes act as descriptors for their instances"""
+
+    def __get__(self, instance, owner):
+        # only a section declaring this class as a field holds a value for it,
+        # anywhere else (plain classes, a child's `_cls_parent`) it is just the class
+        if not (
+            isinstance(instance, Section)
+            and type(instance)._ALL_FIELDS.get(self._field_variable) is self
+        ):
+            return self
+        # Retrieve the section instance from the parent's values
+        return instance._value[self._field_variable]
+
+
 class BaseConfigurationField(ABC):
     """The base class for a configuration field"""
 
@@ -55,6 +83,12 @@ class BaseConfigurationField(ABC):
     _field_variable: None | str
     """The python variable that this field is attached to"""
 
+    _accepts: tuple[type, ...] | None = None
+    """The python types this field can accept, None if not known"""
+
+    _IS_SECTION: bool = False
+    """Is this a section (checked instead of isinstance when dumping)"""
+
     def __call__[T](self, value: T) -> T:
         self._validate_value(value)
         return value
@@ -147,18 +181,82 @@ class SectionParent:
         instance._instance_parent = value
 
 
-class Section(BaseConfigurationField, metaclass=ConfigurationFieldABCMeta):
+def _make_value_builder(section: Type["Section"]) -> Callable[["Section", Any], None]:
+    """Generate a `_build_value` method for a section with each field inlined,
+    so building `_value` does not go through the name/field maps"""
+    namespace: dict[str, Any] = {"_FIELD_NAME_MAP": section._FIELD_NAME_MAP}
+    lines = ["def _build_value(self, value):", "    built = {}"]
+    for c, (name, variable, field) in enumerate(section._FIELD_ITEMS):
+        # nested sections were validated along with this one, or validate as they build
+        namespace[f"_field_{c}"] = (
+            cast(Type["Section"], field)._from_dict_unchecked
+            if isinstance(field, type)
+            else field
+        )
+        lines.append(f"    built[{variable!r}] = _field_{c}(value[{name!r}])")
+    lines += [
+        f"    if len(value.keys()) != {len(section._FIELD_ITEMS)}:",
+        "        raise KeyError(next(name for name in value.keys() if name not in _FIELD_NAME_MAP))",
+        "    self._value = built",
+    ]
+    exec("\n".join(lines), namespace)
+    builder = namespace["_build_value"]
+    builder.__qualname__ = f"{section.__qualname__}._build_value"
+    return builder
+
+
+# defaults of these types can be shared between instances
+_IMMUTABLE_TYPES = frozenset((int, float, str, bool, type(None)))
+
+
+def _make_default_template(
+    triples: tuple[tuple[str, Any, Any], ...],
+) -> tuple[tuple[str, Any, Any], ...] | None:
+    """(variable name, field, value) to build a default `_value` from.
+    Immutable defaults are validated once here and stored with no field,
+    everything else is still built per instance so it isn't shared.
+    Returns None if a default doesn't validate, so the error is raised as usual"""
+    template = []
+    for variable, field, default in triples:
+        if isinstance(field, type) or type(default) not in _IMMUTABLE_TYPES:
+            template.append((variable, field, default))
+            continue
+        try:
+            template.append((variable, None, field(default)))
+        except Exception:
+            return None
+    return tuple(template)
+
+
+class Section(BaseConfigurationField, metaclass=SectionMeta):
     """A baseclass for sections to be defined"""
 
-    __slots__ = "_value"
+    # `_value` comes from BaseConfigurationField
+    __slots__ = ("_instance_name", "_instance_parent")
+
+    _accepts = (dict,)
+    _IS_SECTION = True
 
     _FIELDS: dict[str, AnyConfigField]
     _SECTIONS: dict[str, Type]
     _ALL_FIELDS: dict[str, AnyConfigField | Type]
+    _ALL_FIELD_NAMES: frozenset[str]
+    """The variable names of every field, for fast membership tests"""
     _FIELD_NAME_MAP: dict[str, str]
     """Maps config names to their actual variable names"""
     _FIELD_VAR_MAP: dict[str, str]
     """Maps variable names to their actual config names"""
+    _FIELD_ITEMS: tuple[tuple[str, str, AnyConfigField | Type], ...]
+    """(config name, variable name, field) for every field, in order"""
+    _FIELD_VALIDATORS: tuple[tuple[str, Callable[..., None]], ...]
+    """(config name, bound `_validate_value`) for every field, in order"""
+    _PLAIN_VALIDATORS: dict[str, Callable[..., None]]
+    """Maps variable names to `_validate_value` for fields with the default `__call__`,
+    which store values unchanged once validated"""
+    _CONFIG_NAMES: tuple[str, ...]
+    """The config names of every field, in the same order as `_value`"""
+    _IS_FLAT: bool
+    """Does this section only hold plain values (no sections or tables)"""
     _name = SectionName()
     """The name in the configuration file (chooses between _real_name and _cls_name)"""
     _cls_name: str
@@ -167,9 +265,15 @@ class Section(BaseConfigurationField, metaclass=ConfigurationFieldABCMeta):
     """The actual name in the configuration file"""
     _has_default: bool
     _default_value: dict[str, Any] | _NoDefaultValueT
+    _DEFAULT_TRIPLES: tuple[tuple[str, AnyConfigField | Type, Any], ...] | None
+    """(variable name, field, default) for every field, None without a full default"""
+    _DEFAULT_TEMPLATE: tuple[tuple[str, AnyConfigField | Type | None, Any], ...] | None
+    """Builds `_value` from the default without validating it again"""
     _parent = SectionParent()
     _instance_parent: AnyConfigField | None
     _cls_parent: AnyConfigField | None
+    _build_value: ClassVar[Callable[[Self, Any], None]]
+    """Builds `_value` from a dict keyed by config names (generated per class)"""
 
 
     @classmethod
@@ -177,17 +281,16 @@ class Section(BaseConfigurationField, metaclass=ConfigurationFieldABCMeta):
         super().__init_subclass__(**kwargs)
         cls._cls_parent = None
         cls._cls_name = name or cls.__name__
-        cls._FIELDS = {
-            field_name: field
-            for field_name, field in cls.__dict__.items()
-            if isinstance(field, ConfigurationField)
-        }
-        cls._SECTIONS = {
-            field_name: field
-            for field_name, field in cls.__dict__.items()
-            if isinstance(field, type) and Section in field.__mro__
-        }
-        cls._ALL_FIELDS = cls._FIELDS | cls._SECTIONS
+        fields, sections = {}, {}
+        for field_name, field in cls.__dict__.items():
+            if isinstance(field, ConfigurationField):
+                fields[field_name] = field
+            elif isinstance(field, type) and issubclass(field, Section):
+                sections[field_name] = field
+        cls._FIELDS = fields
+        cls._SECTIONS = sections
+        cls._ALL_FIELDS = fields | sections
+        cls._ALL_FIELD_NAMES = frozenset(cls._ALL_FIELDS)
         for name, field in cls._ALL_FIELDS.items():
             field._field_variable = name
             if field._name is None:
@@ -204,15 +307,39 @@ class Section(BaseConfigurationField, metaclass=ConfigurationFieldABCMeta):
         }
 
         cls._FIELD_VAR_MAP = {value: key for key, value in cls._FIELD_NAME_MAP.items()}
+        cls._FIELD_ITEMS = tuple(
+            (field._name, variable, field) for variable, field in cls._ALL_FIELDS.items()
+        )
+        cls._FIELD_VALIDATORS = tuple(
+            (name, field._validate_value) for name, _, field in cls._FIELD_ITEMS
+        )
+        cls._CONFIG_NAMES = tuple(map(itemgetter(0), cls._FIELD_ITEMS))
+        cls._PLAIN_VALIDATORS = {
+            variable: field._validate_value
+            for variable, field in fields.items()
+            if type(field).__call__ is BaseConfigurationField.__call__
+        }
+        cls._IS_FLAT = not sections and not any(
+            isinstance(field, Table) for field in fields.values()
+        )
+        cls._build_value = _make_value_builder(cls)
 
         # generate default value
-        cls._has_default = all(field._has_default for field in cls._ALL_FIELDS.values())
+        all_fields = cls._ALL_FIELDS.values()
+        cls._has_default = all(map(_get_has_default, all_fields))
         if cls._has_default:
-            cls._default_value = {
-                field._name: field._default_value for field in cls._ALL_FIELDS.values()
-            }
+            cls._default_value = dict(
+                zip(map(_get_name, all_fields), map(_get_default, all_fields))
+            )
+            cls._DEFAULT_TRIPLES = tuple(
+                (variable, field, field._default_value)
+                for variable, field in cls._ALL_FIELDS.items()
+            )
+            cls._DEFAULT_TEMPLATE = _make_default_template(cls._DEFAULT_TRIPLES)
         else:
             cls._default_value = NoDefaultValue
+            cls._DEFAULT_TRIPLES = None
+            cls._DEFAULT_TEMPLATE = None
 
     def __init__(
         self,
@@ -222,18 +349,35 @@ class Section(BaseConfigurationField, metaclass=ConfigurationFieldABCMeta):
     ):
         self._name = self._cls_name
         self._parent = self._cls_parent
+        if value is self._default_value and not kwargs and self._DEFAULT_TEMPLATE:
+            self._value = {
+                variable: default if field is None else field(default)
+                for variable, field, default in self._DEFAULT_TEMPLATE
+            }
+            return
         if isinstance(value, _NoDefaultValueT):
             value = {}
         if not isinstance(value, (dict, Section)):
             raise ValueError(value)
-        value = value | kwargs
+        if kwargs:
+            value = value | kwargs
         self._validate_value(value)
-        self._value = {
-            self._FIELD_NAME_MAP[name]: self._ALL_FIELDS[self._FIELD_NAME_MAP[name]](
-                val
-            )
-            for name, val in value.items()
-        }
+        self._build_value(value)
+
+    @classmethod
+    def _from_dict_unchecked(cls, value: dict[str, Any]) -> Self:
+        """Create a section without the separate validation pass `__init__` does.
+        Every field still validates its value while it is built, the full
+        validation only runs to report an error with the complete field path"""
+        section = cls.__new__(cls)
+        section._name = cls._cls_name
+        section._parent = cls._cls_parent
+        try:
+            section._build_value(value)
+        except Exception:
+            cls._validate_value(value)
+            raise
+        return section
 
     def __get__(self, instance, owner):
         if instance is None:
@@ -247,17 +391,17 @@ class Section(BaseConfigurationField, metaclass=ConfigurationFieldABCMeta):
     def get_field(self, name):
         return object.__getattribute__(self.__class__, name)
 
-    def __getattribute__(self, name: str) -> Any:
-        if name in object.__getattribute__(self, "_ALL_FIELDS").keys():
-            return object.__getattribute__(self, "_value")[name]
-        return super().__getattribute__(name)
-
     def __setattr__(self, name: str, value: Any) -> None:
-        fields = object.__getattribute__(self, "_ALL_FIELDS")
-        if name in fields.keys():
-            object.__getattribute__(self, "_value")[name] = fields[name](value)
+        validate = self._PLAIN_VALIDATORS.get(name)
+        if validate is not None:  # skip the `__call__` wrapper
+            validate(value)
+            self._value[name] = value
+            return
+        field = self._ALL_FIELDS.get(name)
+        if field is None:  # internals go straight to their slots
+            object.__setattr__(self, name, value)
         else:
-            super().__setattr__(name, value)
+            self._value[name] = field(value)
 
     def __getitem__(self, name):
         return self._value[self._FIELD_VAR_MAP[name]]
@@ -272,23 +416,21 @@ class Section(BaseConfigurationField, metaclass=ConfigurationFieldABCMeta):
         return self._value.values()
 
     def __or__(self, other: dict) -> Self:
-        return self.__class__(
-            {self._FIELD_NAME_MAP[key]: value for key, value in self._value.items()}
-            | other
-        )
+        merged = {self._FIELD_NAME_MAP[key]: value for key, value in self._value.items()}
+        merged.update(other)
+        return self.__class__(merged)
 
     @classmethod
     def _validate_value(cls, value: Any, name: str | None = None, /):
         if not isinstance(value, (dict, cls)):
             raise ValueError(value)
-        for field in cls._ALL_FIELDS.values():
-            if field._name not in value.keys():
+        keys = value.keys()
+        for field_name, validate in cls._FIELD_VALIDATORS:
+            if field_name not in keys:
                 raise KeyError(
-                    f'Section, "{name or cls._name}", missing field: {field._name}'
+                    f'Section, "{name or cls._name}", missing field: {field_name}'
                 )  # missing key
-            field._validate_value(
-                value[field._name], f"{name or cls._name}.{field._name}"
-            )
+            validate(value[field_name], f"{name or cls._name}.{field_name}")
 
     @property
     def nullable(self):
@@ -301,6 +443,7 @@ class Float(ConfigurationField):
     __slots__ = ()
 
     _holds: float
+    _accepts = (float, int)
 
     def __get__(self, instance, owner) -> float:
         return super().__get__(instance, owner)
@@ -310,18 +453,68 @@ class Float(ConfigurationField):
 
     def _validate_value(self, value: Any, name: str | None = None, /):
         super()._validate_value(value)
-        if not isinstance(value, (float, int)):
+        value_type = type(value)
+        if value_type is not float and value_type is not int:  # rejects bools
             raise ValueError(
                 f"Field: {name or self._name}\nValue was not a valid number: {repr(value)}"
             )
 
 
+def _any_items(items) -> bool:
+    return True
+
+
+def _integer_items(items) -> bool:
+    return all(type(item) is int for item in items)
+
+
+def _number_items(items) -> bool:
+    return all(type(item) is float or type(item) is int for item in items)
+
+
+def _text_items(field: "Text") -> Callable[[Iterable], bool]:
+    matches = field._matches
+
+    def check(items) -> bool:
+        # the matcher runs over every item in C through `map`
+        return all(type(item) is str for item in items) and all(map(matches, items))
+
+    return check
+
+
+def _all_valid(validate: Callable[[Any], None], items: Iterable) -> bool:
+    """Validate items without labeling each of them.
+    Returns False on the first invalid item, so it can be validated again with its name"""
+    try:
+        for item in items:
+            validate(item)
+    except Exception:
+        return False
+    return True
+
+
+def _items_check(field: AnyConfigField | None) -> Callable[[Iterable], bool] | None:
+    """Pick a single pass check for the items of a collection, so simple items
+    don't need a `_validate_value` call each.
+    Returns None if every item has to be validated on its own"""
+    if field is None:
+        return _any_items
+    if type(field) is Integer and not field._nullable:
+        return _integer_items
+    if type(field) is Float and not field._nullable:
+        return _number_items
+    if type(field) is Text and not field._nullable:
+        return _text_items(field)
+    return None
+
+
 class List[T](ConfigurationField):
     """List field"""
 
-    __slots__ = "inner_type"
+    __slots__ = ("inner_type", "_items_check")
 
     _holds: list[T]
+    _accepts = (list,)
 
     def __init__(
         self,
@@ -332,10 +525,16 @@ class List[T](ConfigurationField):
         **kwargs,
     ):
         self.inner_type = fix_unions(inner_type)
+        self._items_check = _items_check(self.inner_type)
 
         return super().__init__(default_value, *args, **kwargs)
     
     def __call__(self, value: list[T]) -> list[T]:
+        if not isinstance(value, list):
+            self._validate_value(value)  # raises unless this is a null value
+            return value
+        if self._items_check is not None and self._items_check(value):
+            return list(value)
         return [self.inner_type(val) for val in value]
     
     def __get__(self, instance, owner) -> list[T]:
@@ -351,6 +550,9 @@ class List[T](ConfigurationField):
                 f"Field: {name or self._name}\nValue was not a valid list: {value}"
             )
 
+        if self._items_check is not None and self._items_check(value):
+            return
+
         match self.inner_type:
             case None:
                 return
@@ -358,6 +560,9 @@ class List[T](ConfigurationField):
                 raise ValueError(self.inner_type)
 
             case BaseConfigurationField():
+                if _all_valid(self.inner_type._validate_value, value):
+                    return
+                # items are only labeled once one failed, for the error message
                 for c, item in enumerate(value):
                     self.inner_type._validate_value(item, f"{name or self._name}[{c}]")
 
@@ -374,6 +579,10 @@ class TableSpec(ConfigurationField, metaclass=ConfigurationFieldABCMeta):
     """Maps config names to their actual variable names"""
     _FIELD_VAR_MAP: dict[str, str]
     """Maps variable names to their actual config names"""
+    _FIELD_ITEMS: tuple[tuple[str, str, AnyConfigField | Type], ...]
+    """(config name, variable name, field) for every field, in order"""
+    _FIELD_VALIDATORS: tuple[tuple[str, Callable[..., None]], ...]
+    """(config name, bound `_validate_value`) for every field, in order"""
     _cls_name: str
     """The actual name in the configuration file"""
     _cls_has_default: bool
@@ -381,22 +590,21 @@ class TableSpec(ConfigurationField, metaclass=ConfigurationFieldABCMeta):
     _default_value: dict[str, Any] | _NoDefaultValueT
 
     _holds: dict[str, Any]
+    _accepts = (dict,)
 
     @classmethod
     def __init_subclass__(cls, name: str | None = None, **kwargs):
         super().__init_subclass__(**kwargs)
         cls._cls_name = name or cls.__name__
-        cls._FIELDS = {
-            field_name: field
-            for field_name, field in cls.__dict__.items()
-            if isinstance(field, ConfigurationField)
-        }
-        cls._SECTIONS = {
-            field_name: field
-            for field_name, field in cls.__dict__.items()
-            if isinstance(field, type) and Section in field.__mro__
-        }
-        cls._ALL_FIELDS = cls._FIELDS | cls._SECTIONS
+        fields, sections = {}, {}
+        for field_name, field in cls.__dict__.items():
+            if isinstance(field, ConfigurationField):
+                fields[field_name] = field
+            elif isinstance(field, type) and issubclass(field, Section):
+                sections[field_name] = field
+        cls._FIELDS = fields
+        cls._SECTIONS = sections
+        cls._ALL_FIELDS = fields | sections
         for name, field in cls._ALL_FIELDS.items():
             field._field_variable = name
             if field._name is None:
@@ -411,15 +619,20 @@ class TableSpec(ConfigurationField, metaclass=ConfigurationFieldABCMeta):
         }
 
         cls._FIELD_VAR_MAP = {value: key for key, value in cls._FIELD_NAME_MAP.items()}
+        cls._FIELD_ITEMS = tuple(
+            (field._name, variable, field) for variable, field in cls._ALL_FIELDS.items()
+        )
+        cls._FIELD_VALIDATORS = tuple(
+            (name, field._validate_value) for name, _, field in cls._FIELD_ITEMS
+        )
 
         # generate default value
-        cls._cls_has_default = all(
-            field._has_default for field in cls._ALL_FIELDS.values()
-        )
+        all_fields = cls._ALL_FIELDS.values()
+        cls._cls_has_default = all(map(_get_has_default, all_fields))
         if cls._cls_has_default:
-            cls._cls_default_value = {
-                field._name: field._default_value for field in cls._ALL_FIELDS.values()
-            }
+            cls._cls_default_value = dict(
+                zip(map(_get_name, all_fields), map(_get_default, all_fields))
+            )
         else:
             cls._cls_default_value = NoDefaultValue
 
@@ -437,21 +650,34 @@ class TableSpec(ConfigurationField, metaclass=ConfigurationFieldABCMeta):
     def _validate_value(self, value: Any, name: str | None = None, /):
         if not isinstance(value, dict):
             raise ValueError(value)
-        for field in self._ALL_FIELDS.values():
-            if field._name not in value.keys():
+        get = value.get
+        for field_name, validate in self._FIELD_VALIDATORS:
+            # one lookup per field, the sentinel can never be a config value
+            field_value = get(field_name, NoDefaultValue)
+            if field_value is NoDefaultValue:
                 raise KeyError(
-                    f'Table, "{name or self._name}", missing field: {field._name}'
+                    f'Table, "{name or self._name}", missing field: {field_name}'
                 )  # missing key
-            field._validate_value(value[field._name])
+            validate(field_value)
 
 
 class Table[K, V](ConfigurationField):
     """A generic Table"""
 
-    __slots__ = ("key_type", "value_type")
+    __slots__ = (
+        "key_type",
+        "value_type",
+        "_keys_check",
+        "_values_check",
+        "_holds_sections",
+    )
     __match_args__ = ("key_type", "value_type")
 
     _holds: dict[K, V]
+    _accepts = (dict,)
+
+    _holds_sections: bool
+    """can the values of this table be sections"""
 
     def __init__(
         self,
@@ -464,10 +690,23 @@ class Table[K, V](ConfigurationField):
     ):
         self.key_type = fix_unions(key_type)
         self.value_type = fix_unions(value_type)
+        self._keys_check = _items_check(self.key_type)
+        self._values_check = _items_check(self.value_type)
+        self._holds_sections = isinstance(self.value_type, (type, Section, ConfigUnion))
 
         return super().__init__(default_value, *args, **kwargs)
 
     def __call__(self, value: dict[K, V]) -> dict[K, V]:
+        if not isinstance(value, dict):
+            self._validate_value(value)  # raises unless this is a null value
+            return value
+        if (
+            self._keys_check is not None
+            and self._values_check is not None
+            and self._keys_check(value.keys())
+            and self._values_check(value.values())
+        ):
+            return dict(value)
         return {self.key_type(key): self.value_type(val) for key, val in value.items()}
     
     def __get__(self, instance, owner) -> dict[K, V]:
@@ -483,17 +722,20 @@ class Table[K, V](ConfigurationField):
                 f"Field: {name or self._name}\nValue was not a valid dict: {value}"
             )
 
-        if self.key_type is not None:
-            for c, key in enumerate(value.keys()):
-                self.key_type._validate_value(
-                    key, f"{name or self._name}[{key}] (keyname)"
-                )
+        # items are only labeled once one failed, for the error message
+        if self._keys_check is None or not self._keys_check(value.keys()):
+            if not _all_valid(self.key_type._validate_value, value.keys()):
+                for key in value.keys():
+                    self.key_type._validate_value(
+                        key, f"{name or self._name}[{key}] (keyname)"
+                    )
 
-        if self.value_type is not None:
-            for key, val in value.items():
-                self.value_type._validate_value(
-                    val, f"{name or self._name}[{key}] (value)"
-                )
+        if self._values_check is None or not self._values_check(value.values()):
+            if not _all_valid(self.value_type._validate_value, value.values()):
+                for key, val in value.items():
+                    self.value_type._validate_value(
+                        val, f"{name or self._name}[{key}] (value)"
+                    )
 
 
 class Integer(ConfigurationField):
@@ -502,6 +744,7 @@ class Integer(ConfigurationField):
     __slots__ = ()
 
     _holds: int
+    _accepts = (int,)
 
     def __get__(self, instance, owner) -> int:
         return super().__get__(instance, owner)
@@ -511,7 +754,7 @@ class Integer(ConfigurationField):
 
     def _validate_value(self, value: Any, name: str | None = None, /):
         super()._validate_value(value)
-        if not isinstance(value, int):
+        if type(value) is not int:  # rejects bools
             raise ValueError(
                 f"Field: {name or self._name}\nValue was not a valid integer: {repr(value)}"
             )
@@ -521,12 +764,30 @@ type Number = Float
 """More generic number field, just an alias for Float"""
 
 
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _pattern_matcher(regex: str) -> Callable[[str], Any]:
+    """Pick the cheapest way to fully match a string against `regex`"""
+    if regex == r".*":
+        # "." matches anything but a newline
+        return lambda value: "\n" not in value
+    if _REGEX_METACHARACTERS.isdisjoint(regex):
+        # without metacharacters the pattern only matches itself
+        return regex.__eq__
+    return re.compile(regex).fullmatch
+
+
 class Text(ConfigurationField):
     """string field (with optional regex validation)"""
 
-    __slots__ = "_regex_pattern"
+    __slots__ = ("_regex_pattern", "_matches")
 
     _holds: str
+    _accepts = (str,)
+
+    _matches: Callable[[str], Any]
+    """fully matches a string against the pattern, returns a falsy value on failure"""
 
     def __init__(
         self,
@@ -538,6 +799,7 @@ class Text(ConfigurationField):
     ):
         super().__init__(default_value, *args, **kwargs)
         self._regex_pattern = regex
+        self._matches = _pattern_matcher(regex)
 
     def __get__(self, instance, owner) -> str:
         return super().__get__(instance, owner)
@@ -551,38 +813,87 @@ class Text(ConfigurationField):
             raise ValueError(
                 f"Field: {name or self._name}\nValue was not a valid string: {value}"
             )
-        if re.fullmatch(self._regex_pattern, value) is None:
+        if not self._matches(value):
             raise ValueError(
                 f'Field: {name or self._name}\n"{value}" did not match regex pattern: {self._regex_pattern}'
             )
 
 
+# methods that decide which values a field takes
+_CONVERSION_METHODS = ("__call__", "__init__", "_validate_value")
+
+
+def _declared_accepts(field: AnyConfigField | Type) -> tuple[type, ...] | None:
+    """`_accepts` of a field (or section class), None if unknown.
+    It is only trusted from the class that declares it, a subclass overriding
+    how values are converted or validated may accept different types"""
+    cls = field if isinstance(field, type) else type(field)
+    for klass in cls.__mro__:
+        attrs = klass.__dict__
+        if "_accepts" in attrs:
+            return attrs["_accepts"]
+        if any(method in attrs for method in _CONVERSION_METHODS):
+            return None
+    return None
+
+
 class ConfigUnion[L, R](ConfigurationField):
     """union field"""
 
-    __slots__ = ("_left_type", "_right_type")
+    __slots__ = ("_types", "_type_dispatch")
 
     _holds: L | R
 
-    _left_type: AnyConfigField | Type
-    _right_type: AnyConfigField | Type
-
-    def __init__(
-        self,
-        left_type: AnyConfigField | Type,
-        right_type: AnyConfigField | Type,
-        *args,
-        **kwargs,
-    ):
-        super().__init__(NoDefaultValue, *args, **kwargs)
-        self._left_type = fix_unions(left_type)
-        self._right_type = fix_unions(right_type)
-
-    def __call__(self, *args, **kwargs):
-        try:
-            return self._left_type(*args, **kwargs)
-        except ValueError:  # if left side fails, try the right
-            return self._right_type(*args, **kwargs)
+    _types: tuple[AnyConfigField | Type, ...]
+    """the types in this union, tried in order"""
+    _type_dispatch: dict[type, AnyConfigField | Type]
+    """maps python types that only one of the types can accept to that type"""
+
+    def __init__(self, *types: AnyConfigField | Type, **kwargs):
+        super().__init__(NoDefaultValue, **kwargs)
+        flattened: list[AnyConfigField | Type] = []
+        for typ in map(fix_unions, types):
+            # nested unions are merged in, unless their nullability differs
+            if isinstance(typ, ConfigUnion) and typ._nullable == self._nullable:
+                flattened.extend(typ._types)
+            else:
+                flattened.append(typ)
+        self._types = tuple(flattened)
+        self._type_dispatch = self._build_type_dispatch(self._types)
+
+    @staticmethod
+    def _build_type_dispatch(types) -> dict[type, AnyConfigField | Type]:
+        dispatch: dict[type, AnyConfigField | Type] = {}
+        ambiguous = set()
+        for typ in types:
+            accepts = _declared_accepts(typ)
+            if accepts is None:
+                # can't tell what this type accepts, always try them in order
+                return {}
+            for python_type in accepts:
+                if python_type in dispatch:
+                    ambiguous.add(python_type)
+                dispatch[python_type] = typ
+        for python_type in ambiguous:
+            del dispatch[python_type]
+        return dispatch
+
+    def __call__(self, value):
+        if value is None:
+            super()._validate_value(value)
+        typ = self._type_dispatch.get(type(value))
+        if typ is not None:
+            try:
+                return typ(value)
+            except ValueError:  # report the error the same way as below
+                pass
+        *others, last = self._types
+        for typ in others:
+            try:
+                return typ(value)
+            except ValueError:  # if this type fails, try the next
+                continue
+        return last(value)
     
     def __get__(self, instance, owner) -> L | R:
         return super().__get__(instance, owner)
@@ -592,11 +903,19 @@ class ConfigUnion[L, R](ConfigurationField):
 
     def _validate_value(self, value: L | R, name: str | None = None, /):
         super()._validate_value(value)
-        try:
-            self._left_type._validate_value(value, name)
-        except ValueError:  # if left side fails, try the right
-            self._right_type._validate_value(value, name)
-
+        typ = self._type_dispatch.get(type(value))
+        if typ is not None:
+            try:
+                return typ._validate_value(value, name)
+            except ValueError:  # report the error the same way as below
+                pass
+        *others, last = self._types
+        for typ in others:
+            try:
+                return typ._validate_value(value, name)
+            except ValueError:  # if this type fails, try the next
+                continue
+        last._validate_value(value, name)
 
 __all__ = [
     "ConfigurationField",
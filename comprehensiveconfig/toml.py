@@ -1,65 +1,122 @@
+import functools
 import tomllib
+from pathlib import Path
+from typing import Any, Callable
 from . import configio
 from . import spec
 
+_rtoml_loads: Callable[[str], dict[str, Any]] | None
+try:  # optional, much faster parser than the pure python tomllib (see `RtomlWriter`)
+    from rtoml import loads as _rtoml_loads
+except ImportError:
+    _rtoml_loads = None
+
+
+_ESCAPE_TABLE = str.maketrans(
+    {
+        "\n": "\\n",
+        "\t": "\\t",
+        "\r": "\\r",
+        '"': '\\"',
+        "'": "\\'",
+    }
+)
+
 
 def escape(value):
-    return value.translate(
-        str.maketrans(
-            {
-                "\n": "\\n",
-                "\t": "\\t",
-                "\r": "\\r",
-                '"': '\\"',
-                "'": "\\'",
-            }
-        )
-    )
+    return value.translate(_ESCAPE_TABLE)
+
+
+def _format_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+# config strings repeat a lot, equal strings always format the same
+@functools.lru_cache(maxsize=1024)
+def _format_str(value: str) -> str:
+    return f'"{escape(value)}"'
+
+
+# formatters for values by their exact type, anything else goes through `_format_into`
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    int: str,
+    float: str,
+    bool: _format_bool,
+    str: _format_str,
+}
 
 
 def full_section_name(node) -> list[str]:
-    if node._parent is None:
-        return [node._name]
-    return [*full_section_name(node._parent), node._name]
+    names = []
+    while node is not None:
+        names.append(node._name)
+        node = node._parent
+    names.reverse()
+    return names
 
 
 class TomlWriter(configio.ConfigurationWriter):
     @classmethod
-    def dump_section(cls, node) -> list:
+    def dump_section(cls, node, out: list | None = None) -> list:
+        """dump a section as lines appended to `out`,
+        nested sections are added to the same list"""
+        if out is None:
+            out = []
+
         if " " in node._name:
             raise ValueError(node._name)
 
         if node._parent is not None:
-            base = [f"\n[{'.'.join(full_section_name(node)[1:])}]"]
-        else:
-            base = []
+            out.append(f"\n[{'.'.join(full_section_name(node)[1:])}]")
 
         if node.__doc__:
-            base.append(f"# {node.__doc__}")
-
-        return [
-            *base,
-            *(
-                (
-                    "\n".join(cls.dump_section(value))
-                    if isinstance(value, spec.Section)
-                    else cls.dump_field(node, name, node._FIELD_VAR_MAP[name], value)
-                )
-                for name, value in node._value.items()
-            ),
-        ]
+            out.append(f"# {node.__doc__}")
+
+        # `_value` is kept in the same order as `_FIELD_ITEMS`
+        for (name, variable, field), value in zip(node._FIELD_ITEMS, node._value.values()):
+            if field._IS_SECTION:
+                cls.dump_section(value, out)
+            else:
+                out.append(cls.dump_field(node, variable, name, value))
+        return out
 
     @classmethod
     def format_value(cls, value):
+        formatter = _FORMATTERS.get(type(value))
+        if formatter is not None:
+            return formatter(value)
+        out = []
+        cls._format_into(value, out)
+        return "".join(out)
+
+    @classmethod
+    def _format_into(cls, value, out: list[str]):
+        """append the formatted value to `out`,
+        lists and tables are written piece by piece into the same list"""
+        formatter = _FORMATTERS.get(type(value))
+        if formatter is not None:
+            out.append(formatter(value))
+            return
         match value:
             case int() | float():
-                return str(value)
+                out.append(str(value))
             case str():
-                return f'"{escape(value)}"'
+                out.append(_format_str(value))
             case list():
-                return f"[{", ".join([str(cls.format_value(inner_val)) for inner_val in value])}]"
+                out.append("[")
+                for c, inner_val in enumerate(value):
+                    if c:
+                        out.append(", ")
+                    cls._format_into(inner_val, out)
+                out.append("]")
             case dict():
-                return f"{{ {", ".join([f"{key} = {cls.format_value(inner_val)}" for key, inner_val in value.items()])} }}"
+                out.append("{ ")
+                for c, (key, inner_val) in enumerate(value.items()):
+                    if c:
+                        out.append(", ")
+                    out.append(f"{key} = ")
+                    cls._format_into(inner_val, out)
+                out.append(" }")
             case _:
                 raise ValueError(value)
 
@@ -69,17 +126,30 @@ class TomlWriter(configio.ConfigurationWriter):
             field = node.get_field(original_name)
         else:
             field = node
+        dumper = _FIELD_DUMPERS.get(type(field))
+        if dumper is not None:
+            return dumper(cls, field, field_name, value)
+        return cls._dump_other_field(node, field, field_name, value)
+
+    @classmethod
+    def _dump_section_table(cls, table_node: spec.Table, value) -> str:
+        """dump a table of sections, each section as its own sub-table"""
+        for name, val in value.items():
+            if not isinstance(val, spec.Section):
+                continue
+            val._name = name
+            val._parent = table_node
+
+        section_name = '.'.join(full_section_name(table_node)[1:])
+
+        return f"\n[{section_name}]\n{"\n".join(cls.dumps(val) if isinstance(val, spec.Section) else cls.dump_field(val, key, key, val) for key, val in value.items())}"
+
+    @classmethod
+    def _dump_other_field(cls, node, field, field_name: str, value) -> str:
+        """dump fields of types without an entry in `_FIELD_DUMPERS`"""
         match field:
             case spec.Table(spec.Text(), type() | spec.ConfigUnion()) as table_node:
-                for name, val in value.items():
-                    if not isinstance(val, spec.Section):
-                        continue
-                    val._name = name
-                    val._parent = table_node
-                
-                section_name = '.'.join(full_section_name(table_node)[1:])
-
-                return f"\n[{section_name}]\n{"\n".join(cls.dumps(val) if isinstance(val, spec.Section) else cls.dump_field(val, key, key, val) for key, val in value.items())}"
+                return cls._dump_section_table(table_node, value)
             case spec.Section():
                 return "\n".join(cls.dump_section(node))
             case _:
@@ -102,10 +172,51 @@ class TomlWriter(configio.ConfigurationWriter):
 
     @classmethod
     def load(cls, file):
-        if isinstance(file, str):
-            with open(file, "rb") as f:
-                return tomllib.load(f)
-        return tomllib.load(file)
-
-    # just alias the name
-    loads = tomllib.loads
+        if isinstance(file, (str, Path)):
+            with open(file, "rb", buffering=configio.BUFFER_SIZE) as f:
+                return cls.loads(f.read().decode())
+        data = file.read()
+        return cls.loads(data.decode() if isinstance(data, bytes) else data)
+
+    @staticmethod
+    def loads(data: str) -> dict[str, Any]:
+        return tomllib.loads(data)
+
+
+class RtomlWriter(TomlWriter):
+    """TomlWriter that loads with rtoml when it is installed, opt-in since rtoml
+    loads datetimes with its own `TzInfo` instead of `datetime.timezone`.
+    Documents rtoml rejects (like ints wider than 64 bits) are loaded with tomllib"""
+
+    @staticmethod
+    def loads(data: str) -> dict[str, Any]:
+        if _rtoml_loads is not None:
+            try:
+                return _rtoml_loads(data)
+            except ValueError:
+                # retried so real errors are raised as `tomllib.TOMLDecodeError`
+                pass
+        return tomllib.loads(data)
+
+
+def _dump_plain_field(writer, field, field_name: str, value) -> str:
+    return f"{field_name} = {writer.format_value(value)}"
+
+
+def _dump_table_field(writer, field: spec.Table, field_name: str, value) -> str:
+    if isinstance(field.key_type, spec.Text) and isinstance(
+        field.value_type, (type, spec.ConfigUnion)
+    ):
+        return writer._dump_section_table(field, value)
+    return _dump_plain_field(writer, field, field_name, value)
+
+
+# maps the exact type of a field to how it is dumped,
+# these fields never hold a section themselves
+_FIELD_DUMPERS: dict[type, Callable[..., str]] = {
+    spec.Integer: _dump_plain_field,
+    spec.Float: _dump_plain_field,
+    spec.Text: _dump_plain_field,
+    spec.List: _dump_plain_field,
+    spec.Table: _dump_table_field,
+}
@@ -62,6 +62,7 @@ print(x.MySection.some_field)
 
 x.some_field = 12
 p = x.some_field
+assert p == 12, p
 j = x.MySection.other_field
 
 # MyConfigSpec.reset_global()